@@ -3,120 +3,196 @@ import numpy as np
 from datetime import datetime, timedelta
 import json
 
-def create_sales_data():
-    """Create comprehensive sales data"""
-    np.random.seed(42)
-    
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Base unit price per product
+PRODUCT_PRICES = {
+    'Laptop': 1200, 'Desktop': 800, 'Monitor': 300, 'Keyboard': 50,
+    'Mouse': 25, 'Headphones': 100, 'Webcam': 75, 'Tablet': 400
+}
+
+DEPARTMENTS = ['Engineering', 'Sales', 'Marketing', 'HR', 'Finance', 'Operations']
+JOB_LEVELS = ['Junior', 'Mid', 'Senior', 'Lead', 'Manager', 'Director']
+
+# Base salary by department (rows) and job level (columns)
+SAL_TABLE = np.array([
+    [70000, 90000, 120000, 140000, 160000, 200000],  # Engineering
+    [50000, 70000, 90000, 110000, 130000, 180000],   # Sales
+    [55000, 75000, 95000, 115000, 135000, 175000],   # Marketing
+    [50000, 65000, 85000, 105000, 125000, 160000],   # HR
+    [60000, 80000, 100000, 120000, 140000, 190000],  # Finance
+    [55000, 70000, 90000, 110000, 130000, 170000]    # Operations
+])
+
+def draw_sales_columns(rng, n_rows=2000):
+    """Draw the raw sales columns and profit margins as NumPy arrays"""
     # Generate date range
     start_date = datetime(2023, 1, 1)
     end_date = datetime(2024, 12, 31)
     date_range = pd.date_range(start_date, end_date, freq='D')
     
-    products = ['Laptop', 'Desktop', 'Monitor', 'Keyboard', 'Mouse', 'Headphones', 'Webcam', 'Tablet']
+    products = list(PRODUCT_PRICES)
     categories = ['Electronics', 'Accessories', 'Computing', 'Audio']
     regions = ['North America', 'Europe', 'Asia Pacific', 'Latin America']
     sales_channels = ['Online', 'Retail', 'Partner', 'Direct']
+    price_arr = np.array(list(PRODUCT_PRICES.values()))
     
-    data = []
-    for _ in range(2000):
-        product = np.random.choice(products)
-        base_price = {
-            'Laptop': 1200, 'Desktop': 800, 'Monitor': 300, 'Keyboard': 50,
-            'Mouse': 25, 'Headphones': 100, 'Webcam': 75, 'Tablet': 400
-        }[product]
-        
-        data.append({
-            'Date': np.random.choice(date_range),
-            'Product': product,
-            'Category': np.random.choice(categories),
-            'Region': np.random.choice(regions),
-            'Sales_Channel': np.random.choice(sales_channels),
-            'Unit_Price': base_price * np.random.uniform(0.8, 1.3),
-            'Quantity_Sold': np.random.randint(1, 20),
-            'Discount_Percent': np.random.uniform(0, 0.3),
-            'Customer_Rating': np.random.uniform(3.0, 5.0),
-            'Shipping_Cost': np.random.uniform(5, 50),
-            'Marketing_Spend': np.random.uniform(10, 500)
-        })
+    # Draw whole columns at once instead of building rows one by one
+    product_idx = rng.integers(0, len(products), n_rows)
+    base_price = price_arr[product_idx]
     
-    df = pd.DataFrame(data)
+    columns = {
+        'Date': rng.choice(date_range.values, n_rows),
+        'Product': np.asarray(products)[product_idx],
+        'Category': rng.choice(categories, n_rows),
+        'Region': rng.choice(regions, n_rows),
+        'Sales_Channel': rng.choice(sales_channels, n_rows),
+        'Unit_Price': base_price * rng.uniform(0.8, 1.3, n_rows),
+        'Quantity_Sold': rng.integers(1, 20, n_rows),
+        'Discount_Percent': rng.uniform(0, 0.3, n_rows),
+        'Customer_Rating': rng.uniform(3.0, 5.0, n_rows),
+        'Shipping_Cost': rng.uniform(5, 50, n_rows),
+        'Marketing_Spend': rng.uniform(10, 500, n_rows)
+    }
+    profit_margin = rng.uniform(0.1, 0.4, n_rows)
     
-    # Calculate derived columns
-    df['Revenue'] = df['Unit_Price'] * df['Quantity_Sold'] * (1 - df['Discount_Percent'])
-    df['Profit_Margin'] = np.random.uniform(0.1, 0.4, len(df))
-    df['Profit'] = df['Revenue'] * df['Profit_Margin']
-    df['Month'] = df['Date'].dt.month
-    df['Quarter'] = df['Date'].dt.quarter
-    df['Day_of_Week'] = df['Date'].dt.day_name()
+    return columns, profit_margin
+
+def create_sales_data(rng=None):
+    """Create comprehensive sales data, drawing from ``rng`` (seeded Generator by default)"""
+    if rng is None:
+        rng = np.random.default_rng(42)
+    columns, profit_margin = draw_sales_columns(rng)
+    df = pd.DataFrame(columns)
+    
+    # Calculate derived columns (evaluated in one pass, via numexpr when installed)
+    df.eval(
+        """
+        Revenue = Unit_Price * Quantity_Sold * (1 - Discount_Percent)
+        Profit_Margin = @profit_margin
+        Profit = Revenue * Profit_Margin
+        """,
+        inplace=True
+    )
+    dates = pd.DatetimeIndex(df['Date'])
+    df['Month'] = dates.month
+    df['Quarter'] = dates.quarter
+    df['Day_of_Week'] = dates.day_name()
     
     return df
 
-def create_hr_data():
-    """Create HR analytics data"""
-    np.random.seed(123)
+def create_sales_data_polars(rng=None):
+    """Create the same sales data as ``create_sales_data`` as a polars DataFrame"""
+    if pl is None:
+        raise ImportError("create_sales_data_polars requires polars (pip install 'polars>=1.0')")
+    if rng is None:
+        rng = np.random.default_rng(42)
+    columns, profit_margin = draw_sales_columns(rng)
+    
+    revenue = pl.col('Unit_Price') * pl.col('Quantity_Sold') * (1 - pl.col('Discount_Percent'))
+    return (
+        pl.DataFrame(columns)
+        .with_columns(
+            revenue.alias('Revenue'),
+            pl.Series('Profit_Margin', profit_margin)
+        )
+        .with_columns(
+            (pl.col('Revenue') * pl.col('Profit_Margin')).alias('Profit'),
+            # Same dtypes as the pandas calendar fields
+            pl.col('Date').dt.month().cast(pl.Int32).alias('Month'),
+            pl.col('Date').dt.quarter().cast(pl.Int32).alias('Quarter'),
+            pl.col('Date').dt.strftime('%A').alias('Day_of_Week')
+        )
+    )
+
+def create_hr_data(rng=None):
+    """Create HR analytics data, drawing from ``rng`` (seeded Generator by default)"""
+    if rng is None:
+        rng = np.random.default_rng(123)
+    n_rows = 800
     
-    departments = ['Engineering', 'Sales', 'Marketing', 'HR', 'Finance', 'Operations']
-    job_levels = ['Junior', 'Mid', 'Senior', 'Lead', 'Manager', 'Director']
     education = ['High School', 'Bachelor', 'Master', 'PhD']
     
-    data = []
-    for i in range(800):
-        dept = np.random.choice(departments)
-        level = np.random.choice(job_levels)
-        
-        # Base salary by department and level
-        base_salaries = {
-            'Engineering': {'Junior': 70000, 'Mid': 90000, 'Senior': 120000, 'Lead': 140000, 'Manager': 160000, 'Director': 200000},
-            'Sales': {'Junior': 50000, 'Mid': 70000, 'Senior': 90000, 'Lead': 110000, 'Manager': 130000, 'Director': 180000},
-            'Marketing': {'Junior': 55000, 'Mid': 75000, 'Senior': 95000, 'Lead': 115000, 'Manager': 135000, 'Director': 175000},
-            'HR': {'Junior': 50000, 'Mid': 65000, 'Senior': 85000, 'Lead': 105000, 'Manager': 125000, 'Director': 160000},
-            'Finance': {'Junior': 60000, 'Mid': 80000, 'Senior': 100000, 'Lead': 120000, 'Manager': 140000, 'Director': 190000},
-            'Operations': {'Junior': 55000, 'Mid': 70000, 'Senior': 90000, 'Lead': 110000, 'Manager': 130000, 'Director': 170000}
-        }
-        
-        base_salary = base_salaries[dept][level]
-        
-        data.append({
-            'Employee_ID': f"EMP_{i+1:04d}",
-            'Department': dept,
-            'Job_Level': level,
-            'Education': np.random.choice(education),
-            'Years_Experience': np.random.randint(0, 25),
-            'Age': np.random.randint(22, 65),
-            'Salary': base_salary * np.random.uniform(0.9, 1.2),
-            'Performance_Rating': np.random.uniform(2.5, 5.0),
-            'Training_Hours_Annual': np.random.randint(0, 120),
-            'Overtime_Hours_Monthly': np.random.randint(0, 40),
-            'Sick_Days_Annual': np.random.randint(0, 15),
-            'Employee_Satisfaction': np.random.uniform(2.0, 5.0),
-            'Years_at_Company': np.random.randint(0, 20),
-            'Remote_Work_Days': np.random.randint(0, 5)
-        })
+    d_idx = rng.integers(0, len(DEPARTMENTS), n_rows)
+    l_idx = rng.integers(0, len(JOB_LEVELS), n_rows)
+    base_salary = SAL_TABLE[d_idx, l_idx]
     
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'Employee_ID': np.char.add('EMP_', np.char.zfill(np.arange(1, n_rows + 1).astype(str), 4)),
+        'Department': np.asarray(DEPARTMENTS)[d_idx],
+        'Job_Level': np.asarray(JOB_LEVELS)[l_idx],
+        'Education': rng.choice(education, n_rows),
+        'Years_Experience': rng.integers(0, 25, n_rows),
+        'Age': rng.integers(22, 65, n_rows),
+        'Salary': base_salary * rng.uniform(0.9, 1.2, n_rows),
+        'Performance_Rating': rng.uniform(2.5, 5.0, n_rows),
+        'Training_Hours_Annual': rng.integers(0, 120, n_rows),
+        'Overtime_Hours_Monthly': rng.integers(0, 40, n_rows),
+        'Sick_Days_Annual': rng.integers(0, 15, n_rows),
+        'Employee_Satisfaction': rng.uniform(2.0, 5.0, n_rows),
+        'Years_at_Company': rng.integers(0, 20, n_rows),
+        'Remote_Work_Days': rng.integers(0, 5, n_rows)
+    })
 
-def save_sample_datasets():
-    """Save multiple sample datasets"""
+def save_sample_datasets(write_excel=False, backend='pandas'):
+    """Save multiple sample datasets (backend='polars' builds and writes sales data with polars)"""
+    use_polars = backend == 'polars' and pl is not None
+    if backend == 'polars' and not use_polars:
+        print("polars is not installed, falling back to pandas")
     
     # Sales data
-    sales_df = create_sales_data()
-    sales_df.to_csv('sample_sales_comprehensive.csv', index=False)
-    sales_df.to_excel('sample_sales_comprehensive.xlsx', index=False)
+    if use_polars:
+        sales_pl = create_sales_data_polars()
+        sales_pl.write_parquet('sample_sales_comprehensive.parquet', compression='zstd')
+        # Dates are all at midnight, which pandas writes as plain dates
+        sales_pl.write_csv('sample_sales_comprehensive.csv', datetime_format='%Y-%m-%d')
+    else:
+        sales_df = create_sales_data()
+        sales_df.to_parquet('sample_sales_comprehensive.parquet', compression='zstd', index=False)
+        sales_df.to_csv('sample_sales_comprehensive.csv', index=False)
     
     # HR data
     hr_df = create_hr_data()
+    hr_df.to_parquet('sample_hr_analytics.parquet', compression='zstd', index=False)
     hr_df.to_csv('sample_hr_analytics.csv', index=False)
     
-    # JSON format
-    sales_json = sales_df.head(100).to_dict('records')
-    with open('sample_sales_data.json', 'w') as f:
-        json.dump(sales_json, f, indent=2, default=str)
+    # JSON format (dates formatted up front so no per-cell fallback is needed)
+    if use_polars:
+        sales_json = sales_pl.head(100).with_columns(
+            pl.col('Date').dt.strftime('%Y-%m-%d %H:%M:%S')
+        ).to_dicts()
+    else:
+        sales_head = sales_df.head(100).copy()
+        sales_head['Date'] = sales_head['Date'].dt.strftime('%Y-%m-%d %H:%M:%S')
+        sales_json = sales_head.to_dict('records')
+    if orjson is not None:
+        with open('sample_sales_data.json', 'wb') as f:
+            f.write(orjson.dumps(sales_json, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+    else:
+        with open('sample_sales_data.json', 'w') as f:
+            json.dump(sales_json, f, indent=2)
     
     print("Sample datasets created:")
+    print("- sample_sales_comprehensive.parquet")
     print("- sample_sales_comprehensive.csv")
-    print("- sample_sales_comprehensive.xlsx") 
+    print("- sample_hr_analytics.parquet")
     print("- sample_hr_analytics.csv")
     print("- sample_sales_data.json")
+    
+    # Excel output is opt-in: openpyxl is by far the slowest writer
+    if write_excel:
+        if use_polars:
+            sales_df = sales_pl.to_pandas()
+        sales_df.to_excel('sample_sales_comprehensive.xlsx', index=False)
+        print("- sample_sales_comprehensive.xlsx")
 
 if __name__ == "__main__":
     save_sample_datasets()
\ No newline at end of file
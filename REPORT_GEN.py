@@ -3,24 +3,241 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from fpdf import FPDF
+from fpdf.enums import XPos, YPos
 from datetime import datetime, timedelta
 import json
 import csv
 import os
 from io import BytesIO
 import base64
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+import pyarrow as pa
+import pyarrow.json as pa_json
+from jinja2 import Template
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# pandas only knows the calamine Excel engine from 2.2 on
+CALAMINE_AVAILABLE = (
+    tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2)
+    and importlib.util.find_spec('python_calamine') is not None
+)
+
+# Above this many rows the report charts are rendered in parallel worker processes
+PARALLEL_CHART_ROWS = 10_000
+
+# Readable pie chart labels for numpy dtype kind codes
+DTYPE_KIND_LABELS = {'i': 'int', 'u': 'uint', 'f': 'float', 'c': 'complex', 'b': 'bool',
+                     'O': 'object', 'U': 'string', 'S': 'bytes', 'M': 'datetime', 'm': 'timedelta'}
+
+# JSON arrays larger than this are streamed in chunks of JSON_STREAM_ROWS records
+JSON_STREAM_BYTES = 100 * 1024 * 1024
+JSON_STREAM_ROWS = 50_000
+
+HTML_REPORT_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{{ title }}</title>
+<style>
+  body { font-family: Helvetica, Arial, sans-serif; margin: 2em auto; max-width: 1000px; color: #222; }
+  h1 { text-align: center; }
+  .meta { text-align: center; color: #666; }
+  table { border-collapse: collapse; margin: 1em 0; font-size: 0.9em; }
+  th, td { border: 1px solid #ccc; padding: 4px 8px; text-align: right; }
+  img { max-width: 100%; }
+</style>
+</head>
+<body>
+<h1>{{ title }}</h1>
+<p class="meta">Generated on: {{ generated_on }}</p>
+
+<h2>Data Overview</h2>
+<ul>
+  <li>Total Rows: {{ basic_stats.get('total_rows', 'N/A') }}</li>
+  <li>Total Columns: {{ basic_stats.get('total_columns', 'N/A') }}</li>
+  <li>Missing Values: {{ basic_stats.get('missing_values', 'N/A') }}</li>
+</ul>
+
+{% for chart_title, chart_src in charts %}
+<h2>{{ chart_title }}</h2>
+<img src="{{ chart_src }}" alt="{{ chart_title }}">
+{% endfor %}
+
+{% if summary_table %}
+<h2>Statistical Summary</h2>
+{{ summary_table|safe }}
+{% endif %}
+
+{% if data_files %}
+<h2>Data Files</h2>
+<ul>
+{% for path in data_files %}
+  <li><a href="{{ path }}">{{ path }}</a></li>
+{% endfor %}
+</ul>
+{% endif %}
+</body>
+</html>
+"""
+
+def records_to_table(rows):
+    """Convert a list of record dicts to an Arrow table, keeping keys missing from the first record"""
+    # Table.from_pylist only takes its columns from the first record; a struct array
+    # infers its fields from every record in the chunk
+    return pa.Table.from_batches([pa.RecordBatch.from_struct_array(pa.array(rows))])
+
+def read_json_records(file_path):
+    """Read a JSON file into a DataFrame, streaming large top-level arrays when ijson is available"""
+    with open(file_path, 'rb') as f:
+        first_char = f.read(64).lstrip()[:1]
+        f.seek(0)
+        
+        if ijson is not None and first_char == b'[' and os.path.getsize(file_path) > JSON_STREAM_BYTES:
+            # Convert the records to Arrow chunk by chunk instead of holding them all as Python objects
+            # Each chunk infers its own schema; concat widens types (int -> double) and adds
+            # keys first seen in later chunks
+            try:
+                tables, rows = [], []
+                for item in ijson.items(f, 'item', use_float=True):
+                    rows.append(item)
+                    if len(rows) == JSON_STREAM_ROWS:
+                        tables.append(records_to_table(rows))
+                        rows = []
+                if rows:
+                    tables.append(records_to_table(rows))
+                if tables:
+                    return pa.concat_tables(tables, promote_options='permissive').to_pandas()
+                return pd.DataFrame()
+            except (pa.ArrowTypeError, pa.ArrowInvalid):
+                # Types Arrow cannot reconcile (e.g. int and str in one column): re-read in memory
+                # so the result matches the non-streamed path
+                f.seek(0)
+        
+        if orjson is not None:
+            return pd.DataFrame(orjson.loads(f.read()))
+        return pd.DataFrame(json.load(f))
+
+def count_nulls(series):
+    """Count missing values in a column without materializing a full mask frame"""
+    return int(series.isna().to_numpy().sum())
+
+def figure_to_png(dpi=150):
+    """Render the current matplotlib figure to an in-memory PNG and close it"""
+    buf = BytesIO()
+    plt.savefig(buf, format='png', dpi=dpi, bbox_inches='tight')
+    plt.close()
+    buf.seek(0)
+    return buf
+
+def render_overview(null_mask, columns, dtype_labels, dtype_counts,
+                    hist_cols, hist_values, table_values, table_columns):
+    """Render the data overview dashboard"""
+    plt.style.use('seaborn-v0_8')
+    fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+    fig.suptitle('Data Overview Dashboard', fontsize=16, fontweight='bold')
+    
+    # Missing values heatmap
+    if null_mask is not None:
+        # imshow draws the mask as one raster instead of one patch per cell
+        image = axes[0,0].imshow(null_mask, aspect='auto', cmap='gray_r',
+                                 interpolation='nearest', vmin=0, vmax=1)
+        fig.colorbar(image, ax=axes[0,0])
+        axes[0,0].grid(False)
+        axes[0,0].set_xticks(range(len(columns)))
+        axes[0,0].set_xticklabels(columns, rotation=90, fontsize=7)
+        axes[0,0].set_title('Missing Values Pattern')
+    else:
+        axes[0,0].text(0.5, 0.5, 'No Missing Values', ha='center', va='center', fontsize=14)
+        axes[0,0].set_title('Missing Values Pattern')
+    
+    # Data types distribution
+    axes[0,1].pie(dtype_counts, labels=dtype_labels, autopct='%1.1f%%')
+    axes[0,1].set_title('Data Types Distribution')
+    
+    # Numeric columns distribution
+    if len(hist_cols) > 0:
+        # One small histogram per column inside this panel, each on its own scale
+        axes[1,0].axis('off')
+        axes[1,0].set_title('Numeric Distributions')
+        hist_grid = axes[1,0].get_subplotspec().subgridspec(2, 2, hspace=0.5, wspace=0.3)
+        for i, (col, values) in enumerate(zip(hist_cols, hist_values)):
+            hist_ax = fig.add_subplot(hist_grid[i // 2, i % 2])
+            hist_ax.hist(values[~np.isnan(values)], bins=20, alpha=0.7)
+            hist_ax.set_xlabel(col, fontsize=8)
+            hist_ax.tick_params(labelsize=7)
+    
+    # Sample data preview
+    axes[1,1].axis('tight')
+    axes[1,1].axis('off')
+    table = axes[1,1].table(cellText=table_values,
+                            colLabels=table_columns,
+                            cellLoc='center',
+                            loc='center')
+    table.auto_set_font_size(False)
+    table.set_fontsize(8)
+    axes[1,1].set_title('Data Sample')
+    
+    plt.tight_layout()
+    return figure_to_png()
+
+def render_correlation(correlation_values, columns):
+    """Render the correlation matrix heatmap"""
+    plt.style.use('seaborn-v0_8')
+    plt.figure(figsize=(10, 8))
+    if len(columns) <= 12:
+        sns.heatmap(pd.DataFrame(correlation_values, index=columns, columns=columns),
+                    annot=True, cmap='coolwarm', center=0, square=True, fmt='.2f')
+    else:
+        # Too many cells to annotate legibly; draw a single raster instead
+        image = plt.imshow(correlation_values, cmap='coolwarm', vmin=-1, vmax=1)
+        plt.colorbar(image)
+        plt.grid(False)
+        plt.xticks(range(len(columns)), columns, rotation=90)
+        plt.yticks(range(len(columns)), columns)
+    plt.title('Correlation Matrix', fontsize=16, fontweight='bold')
+    plt.tight_layout()
+    return figure_to_png()
+
+def render_categorical(top_values):
+    """Render bar charts of the most frequent values in up to four categorical columns"""
+    plt.style.use('seaborn-v0_8')
+    fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+    fig.suptitle('Categorical Data Analysis', fontsize=16, fontweight='bold')
+    
+    for i, (col, labels, counts) in enumerate(top_values):
+        row, col_idx = i // 2, i % 2
+        axes[row, col_idx].bar(range(len(counts)), counts)
+        axes[row, col_idx].set_xticks(range(len(counts)))
+        axes[row, col_idx].set_xticklabels(labels)
+        axes[row, col_idx].set_xlabel(col)
+        axes[row, col_idx].set_title(f'Top Values in {col}')
+        axes[row, col_idx].tick_params(axis='x', rotation=45)
+    
+    # Hide unused subplots
+    for i in range(len(top_values), 4):
+        row, col_idx = i // 2, i % 2
+        axes[row, col_idx].axis('off')
+    
+    plt.tight_layout()
+    return figure_to_png()
 
 class AutomatedReportGenerator:
     def __init__(self):
         self.data = None
         self.analysis_results = {}
-        self.charts_path = "temp_charts/"
-        self.ensure_charts_directory()
-    
-    def ensure_charts_directory(self):
-        """Create charts directory if it doesn't exist"""
-        if not os.path.exists(self.charts_path):
-            os.makedirs(self.charts_path)
+        self._cached_data = None
+        self._correlations = None
+        self._category_counts = None
     
     def load_data(self, file_path, file_type='auto'):
         """Load data from various file formats"""
@@ -29,16 +246,21 @@ class AutomatedReportGenerator:
                 file_type = file_path.split('.')[-1].lower()
             
             if file_type in ['csv']:
-                self.data = pd.read_csv(file_path)
+                self.data = pd.read_csv(file_path, engine='pyarrow')
+            elif file_type == 'parquet':
+                self.data = pd.read_parquet(file_path, engine='pyarrow')
             elif file_type in ['xlsx', 'xls']:
-                self.data = pd.read_excel(file_path)
+                # calamine is much faster than openpyxl when it is installed (pandas >= 2.2)
+                engine = 'calamine' if CALAMINE_AVAILABLE else None
+                self.data = pd.read_excel(file_path, engine=engine)
             elif file_type == 'json':
-                with open(file_path, 'r') as f:
-                    json_data = json.load(f)
-                self.data = pd.DataFrame(json_data)
+                self.data = read_json_records(file_path)
+            elif file_type in ['jsonl', 'ndjson']:
+                self.data = pa_json.read_json(file_path).to_pandas()
             else:
                 raise ValueError(f"Unsupported file type: {file_type}")
             
+            self.analysis_results = {}
             print(f"Data loaded successfully: {len(self.data)} rows, {len(self.data.columns)} columns")
             return True
             
@@ -46,131 +268,144 @@ class AutomatedReportGenerator:
             print(f"Error loading data: {e}")
             return False
     
+    def cache_column_info(self):
+        """Cache column selections and the missing-value count shared by analysis and charts"""
+        # The cache belongs to this exact frame; assigning a new one to self.data invalidates it
+        self._cached_data = self.data
+        self._correlations = None
+        self._category_counts = None
+        self._numeric_cols = self.data.select_dtypes(include=[np.number]).columns
+        self._cat_cols = self.data.select_dtypes(include=['object']).columns
+        self._numeric_df = self.data[self._numeric_cols]
+        self._null_total = sum(count_nulls(series) for _, series in self.data.items())
+    
+    def _ensure_column_cache(self):
+        """Rebuild the column cache if self.data is not the frame it was built from"""
+        if self._cached_data is not self.data:
+            self.cache_column_info()
+    
+    def compute_correlations(self):
+        """Compute (once per cached frame) the correlation matrix of the numeric columns"""
+        self._ensure_column_cache()
+        if self._correlations is not None:
+            return self._correlations
+        
+        values = self._numeric_df.to_numpy(dtype=float, na_value=np.nan)
+        if len(self._numeric_cols) < 2 or np.isnan(values).any():
+            # pandas handles missing values pairwise
+            self._correlations = self._numeric_df.corr()
+        else:
+            # Dense data: a single np.corrcoef call skips pandas' per-pair NaN handling
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr = np.corrcoef(values, rowvar=False)
+            self._correlations = pd.DataFrame(corr, index=self._numeric_cols, columns=self._numeric_cols)
+        return self._correlations
+    
+    def compute_category_counts(self):
+        """Count (once per cached frame) the values of each categorical column, most frequent first"""
+        self._ensure_column_cache()
+        if self._category_counts is None:
+            # Counting on category codes is much cheaper than hashing raw objects
+            cats = self.data[self._cat_cols].astype('category')
+            self._category_counts = {col: cats[col].value_counts(sort=True) for col in self._cat_cols}
+        return self._category_counts
+    
     def analyze_data(self):
         """Perform comprehensive data analysis"""
         if self.data is None:
             print("No data loaded for analysis")
             return False
         
+        self.cache_column_info()
+        
         # Basic statistics
         self.analysis_results['basic_stats'] = {
             'total_rows': len(self.data),
             'total_columns': len(self.data.columns),
-            'missing_values': self.data.isnull().sum().sum(),
+            'missing_values': self._null_total,
             'data_types': self.data.dtypes.to_dict()
         }
         
         # Numerical analysis
-        numeric_columns = self.data.select_dtypes(include=[np.number]).columns
-        if len(numeric_columns) > 0:
-            self.analysis_results['numeric_summary'] = self.data[numeric_columns].describe()
-            self.analysis_results['correlations'] = self.data[numeric_columns].corr()
+        if len(self._numeric_cols) > 0:
+            self.analysis_results['numeric_summary'] = self._numeric_df.describe()
+            self.analysis_results['correlations'] = self.compute_correlations()
         
         # Categorical analysis
-        categorical_columns = self.data.select_dtypes(include=['object']).columns
-        if len(categorical_columns) > 0:
+        if len(self._cat_cols) > 0:
             self.analysis_results['categorical_summary'] = {}
-            for col in categorical_columns:
+            for col, counts in self.compute_category_counts().items():
+                # Categories come from the data, so every one of them is a distinct value
                 self.analysis_results['categorical_summary'][col] = {
-                    'unique_values': self.data[col].nunique(),
-                    'top_values': self.data[col].value_counts().head(5).to_dict()
+                    'unique_values': len(counts),
+                    'top_values': counts[:5].to_dict()
                 }
         
         return True
     
     def generate_charts(self):
-        """Generate various charts for the report"""
+        """Generate various charts for the report as (name, PNG buffer) pairs"""
         if self.data is None:
             return []
         
-        chart_files = []
-        plt.style.use('seaborn-v0_8')
+        self._ensure_column_cache()
+        numeric_cols = self._numeric_cols
+        categorical_cols = self._cat_cols
         
-        # Chart 1: Data Overview
-        fig, axes = plt.subplots(2, 2, figsize=(12, 10))
-        fig.suptitle('Data Overview Dashboard', fontsize=16, fontweight='bold')
+        # Each chart gets plain arrays rather than the DataFrame, so jobs stay cheap to pickle
+        jobs = []
         
-        # Missing values heatmap
-        if self.data.isnull().sum().sum() > 0:
-            sns.heatmap(self.data.isnull(), cbar=True, ax=axes[0,0])
-            axes[0,0].set_title('Missing Values Pattern')
-        else:
-            axes[0,0].text(0.5, 0.5, 'No Missing Values', ha='center', va='center', fontsize=14)
-            axes[0,0].set_title('Missing Values Pattern')
-        
-        # Data types distribution
-        dtype_counts = self.data.dtypes.value_counts()
-        axes[0,1].pie(dtype_counts.values, labels=dtype_counts.index, autopct='%1.1f%%')
-        axes[0,1].set_title('Data Types Distribution')
-        
-        # Numeric columns distribution
-        numeric_cols = self.data.select_dtypes(include=[np.number]).columns
-        if len(numeric_cols) > 0:
-            self.data[numeric_cols[:4]].hist(ax=axes[1,0], bins=20, alpha=0.7)
-            axes[1,0].set_title('Numeric Distributions')
-        
-        # Sample data preview
-        axes[1,1].axis('tight')
-        axes[1,1].axis('off')
-        table_data = self.data.head(5).round(2) if len(self.data) > 0 else pd.DataFrame()
-        table = axes[1,1].table(cellText=table_data.values,
-                               colLabels=table_data.columns,
-                               cellLoc='center',
-                               loc='center')
-        table.auto_set_font_size(False)
-        table.set_fontsize(8)
-        axes[1,1].set_title('Data Sample')
-        
-        plt.tight_layout()
-        chart1_path = f"{self.charts_path}overview_dashboard.png"
-        plt.savefig(chart1_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart1_path)
+        # Chart 1: Data Overview
+        # The full mask is only needed (and built) when there is something to plot
+        null_mask = self.data.isnull().to_numpy().astype(np.uint8) if self._null_total > 0 else None
+        # Bucket columns by dtype kind (one character each) for short, stable pie labels
+        kinds = np.array([dtype.kind for dtype in self.data.dtypes])
+        dtype_kinds, dtype_counts = np.unique(kinds, return_counts=True)
+        hist_cols = list(numeric_cols[:4])
+        hist_values = [self._numeric_df[col].to_numpy(dtype=float, na_value=np.nan) for col in hist_cols]
+        # Pre-format the sample rows once so the table renderer only sees strings;
+        # floats are formatted in one vectorized call instead of rounding every column
+        head = self.data.head(5)
+        table_data = head.astype(str)
+        float_cols = [col for col in numeric_cols if head[col].dtype.kind == 'f']
+        if float_cols:
+            table_data[float_cols] = np.char.mod('%.2f', head[float_cols].to_numpy(dtype=float, na_value=np.nan))
+        jobs.append(('overview_dashboard', render_overview, (
+            null_mask, list(self.data.columns),
+            [DTYPE_KIND_LABELS.get(kind, kind) for kind in dtype_kinds], dtype_counts,
+            hist_cols, hist_values,
+            table_data.to_numpy(), list(table_data.columns)
+        )))
         
         # Chart 2: Correlation Matrix (if numeric data exists)
         if len(numeric_cols) > 1:
-            plt.figure(figsize=(10, 8))
-            correlation_matrix = self.data[numeric_cols].corr()
-            sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0,
-                       square=True, fmt='.2f')
-            plt.title('Correlation Matrix', fontsize=16, fontweight='bold')
-            plt.tight_layout()
-            chart2_path = f"{self.charts_path}correlation_matrix.png"
-            plt.savefig(chart2_path, dpi=300, bbox_inches='tight')
-            plt.close()
-            chart_files.append(chart2_path)
+            correlation_matrix = self.compute_correlations()
+            jobs.append(('correlation_matrix', render_correlation, (
+                correlation_matrix.to_numpy(), list(numeric_cols)
+            )))
         
         # Chart 3: Top Categories (if categorical data exists)
-        categorical_cols = self.data.select_dtypes(include=['object']).columns
         if len(categorical_cols) > 0:
-            fig, axes = plt.subplots(2, 2, figsize=(12, 10))
-            fig.suptitle('Categorical Data Analysis', fontsize=16, fontweight='bold')
-            
-            for i, col in enumerate(categorical_cols[:4]):
-                row, col_idx = i // 2, i % 2
-                top_values = self.data[col].value_counts().head(10)
-                top_values.plot(kind='bar', ax=axes[row, col_idx])
-                axes[row, col_idx].set_title(f'Top Values in {col}')
-                axes[row, col_idx].tick_params(axis='x', rotation=45)
-            
-            # Hide unused subplots
-            for i in range(len(categorical_cols), 4):
-                row, col_idx = i // 2, i % 2
-                axes[row, col_idx].axis('off')
-            
-            plt.tight_layout()
-            chart3_path = f"{self.charts_path}categorical_analysis.png"
-            plt.savefig(chart3_path, dpi=300, bbox_inches='tight')
-            plt.close()
-            chart_files.append(chart3_path)
+            top_values = []
+            category_counts = self.compute_category_counts()
+            for col in categorical_cols[:4]:
+                counts = category_counts[col][:10]
+                top_values.append((col, [str(value) for value in counts.index], counts.to_numpy()))
+            jobs.append(('categorical_analysis', render_categorical, (top_values,)))
         
-        return chart_files
+        if len(self.data) > PARALLEL_CHART_ROWS:
+            # Figures are independent, so large jobs render them in separate processes
+            with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = [(name, executor.submit(render, *args)) for name, render, args in jobs]
+                return [(name, future.result()) for name, future in futures]
+        
+        return [(name, render(*args)) for name, render, args in jobs]
     
     def generate_pdf_report(self, output_path="automated_report.pdf", report_title="Data Analysis Report"):
         """Generate comprehensive PDF report using FPDF"""
         
         # Generate charts
-        chart_files = self.generate_charts()
+        charts = self.generate_charts()
         
         # Create PDF
         pdf = FPDF()
@@ -178,18 +413,18 @@ class AutomatedReportGenerator:
         
         # Title page
         pdf.add_page()
-        pdf.set_font('Arial', 'B', 24)
-        pdf.cell(0, 30, report_title, 0, 1, 'C')
+        pdf.set_font('Helvetica', 'B', 24)
+        pdf.cell(0, 30, report_title, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='C')
         
-        pdf.set_font('Arial', '', 12)
-        pdf.cell(0, 10, f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 0, 1, 'C')
-        pdf.cell(0, 10, f"Generated by: PhantomX256", 0, 1, 'C')
+        pdf.set_font('Helvetica', '', 12)
+        pdf.cell(0, 10, f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='C')
+        pdf.cell(0, 10, f"Generated by: PhantomX256", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='C')
         
         # Executive Summary
         pdf.ln(20)
-        pdf.set_font('Arial', 'B', 16)
-        pdf.cell(0, 10, 'Executive Summary', 0, 1, 'L')
-        pdf.set_font('Arial', '', 12)
+        pdf.set_font('Helvetica', 'B', 16)
+        pdf.cell(0, 10, 'Executive Summary', new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L')
+        pdf.set_font('Helvetica', '', 12)
         
         summary_text = f"""
 This automated report provides a comprehensive analysis of the loaded dataset containing 
@@ -201,68 +436,94 @@ breakdowns. The analysis reveals patterns and insights that can inform business
 decisions and data-driven strategies.
         """
         
-        # Split text into lines for PDF
-        lines = summary_text.strip().split('\n')
-        for line in lines:
-            if line.strip():
-                pdf.cell(0, 6, line.strip(), 0, 1, 'L')
+        # Let multi_cell wrap each paragraph to the page width in one call
+        paragraphs = [' '.join(p.split()) for p in summary_text.strip().split('\n\n')]
+        pdf.multi_cell(0, 6, '\n\n'.join(paragraphs))
         
         # Data Overview Section
         pdf.add_page()
-        pdf.set_font('Arial', 'B', 16)
-        pdf.cell(0, 10, 'Data Overview', 0, 1, 'L')
+        pdf.set_font('Helvetica', 'B', 16)
+        pdf.cell(0, 10, 'Data Overview', new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L')
         
         basic_stats = self.analysis_results.get('basic_stats', {})
-        pdf.set_font('Arial', '', 12)
-        pdf.cell(0, 8, f"Total Rows: {basic_stats.get('total_rows', 'N/A')}", 0, 1, 'L')
-        pdf.cell(0, 8, f"Total Columns: {basic_stats.get('total_columns', 'N/A')}", 0, 1, 'L')
-        pdf.cell(0, 8, f"Missing Values: {basic_stats.get('missing_values', 'N/A')}", 0, 1, 'L')
+        pdf.set_font('Helvetica', '', 12)
+        pdf.cell(0, 8, f"Total Rows: {basic_stats.get('total_rows', 'N/A')}", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L')
+        pdf.cell(0, 8, f"Total Columns: {basic_stats.get('total_columns', 'N/A')}", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L')
+        pdf.cell(0, 8, f"Missing Values: {basic_stats.get('missing_values', 'N/A')}", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L')
         
         # Add charts
-        for i, chart_path in enumerate(chart_files):
-            if os.path.exists(chart_path):
-                if i > 0:  # Add new page for subsequent charts
-                    pdf.add_page()
-                
-                pdf.set_font('Arial', 'B', 14)
-                chart_title = os.path.basename(chart_path).replace('.png', '').replace('_', ' ').title()
-                pdf.cell(0, 10, chart_title, 0, 1, 'L')
-                
-                # Add image
-                try:
-                    pdf.image(chart_path, x=10, y=pdf.get_y()+5, w=190)
-                except:
-                    pdf.cell(0, 10, f"Chart could not be loaded: {chart_path}", 0, 1, 'L')
+        for i, (chart_name, chart_png) in enumerate(charts):
+            if i > 0:  # Add new page for subsequent charts
+                pdf.add_page()
+            
+            pdf.set_font('Helvetica', 'B', 14)
+            chart_title = chart_name.replace('_', ' ').title()
+            pdf.cell(0, 10, chart_title, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L')
+            
+            # Add image
+            try:
+                pdf.image(chart_png, x=10, y=pdf.get_y()+5, w=190)
+            except:
+                pdf.cell(0, 10, f"Chart could not be loaded: {chart_name}", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L')
         
         # Statistical Summary
         if 'numeric_summary' in self.analysis_results:
             pdf.add_page()
-            pdf.set_font('Arial', 'B', 16)
-            pdf.cell(0, 10, 'Statistical Summary', 0, 1, 'L')
+            pdf.set_font('Helvetica', 'B', 16)
+            pdf.cell(0, 10, 'Statistical Summary', new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L')
             
-            pdf.set_font('Arial', '', 10)
+            pdf.set_font('Helvetica', '', 10)
             summary_df = self.analysis_results['numeric_summary']
+            stats = [stat for stat in ['mean', 'std', 'min', 'max'] if stat in summary_df.index]
             
             # Create a simple table
-            for col in summary_df.columns[:3]:  # Show first 3 numeric columns
-                pdf.ln(5)
-                pdf.set_font('Arial', 'B', 12)
-                pdf.cell(0, 8, f"Column: {col}", 0, 1, 'L')
-                pdf.set_font('Arial', '', 10)
-                
-                for stat in ['mean', 'std', 'min', 'max']:
-                    if stat in summary_df.index:
-                        value = summary_df.loc[stat, col]
-                        pdf.cell(0, 6, f"{stat.title()}: {value:.2f}", 0, 1, 'L')
+            pdf.ln(5)
+            with pdf.table() as table:
+                header = table.row()
+                for label in ['Column'] + [stat.title() for stat in stats]:
+                    header.cell(label)
+                for col in summary_df.columns[:3]:  # Show first 3 numeric columns
+                    row = table.row()
+                    row.cell(str(col))
+                    for stat in stats:
+                        row.cell(f"{summary_df.loc[stat, col]:.2f}")
         
         # Save PDF
         pdf.output(output_path)
         print(f"Report generated successfully: {output_path}")
         
-        # Clean up temporary chart files
-        for chart_path in chart_files:
-            if os.path.exists(chart_path):
-                os.remove(chart_path)
+        return output_path
+    
+    def generate_html_report(self, output_path="automated_report.html", report_title="Data Analysis Report"):
+        """Generate an HTML report with charts inlined, plus the statistics tables as Parquet"""
+        charts = self.generate_charts()
+        
+        # Statistics tables go next to the report as Parquet for downstream tools
+        base_path = os.path.splitext(output_path)[0]
+        data_files = []
+        for key in ['numeric_summary', 'correlations']:
+            if key in self.analysis_results:
+                table_path = f"{base_path}_{key}.parquet"
+                self.analysis_results[key].rename(columns=str).to_parquet(table_path, engine='pyarrow')
+                data_files.append(table_path)
+        
+        summary_df = self.analysis_results.get('numeric_summary')
+        html = Template(HTML_REPORT_TEMPLATE, autoescape=True).render(
+            title=report_title,
+            generated_on=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            basic_stats=self.analysis_results.get('basic_stats', {}),
+            charts=[
+                (name.replace('_', ' ').title(),
+                 'data:image/png;base64,' + base64.b64encode(png.getvalue()).decode('ascii'))
+                for name, png in charts
+            ],
+            summary_table=summary_df.round(2).to_html() if summary_df is not None else None,
+            data_files=[os.path.basename(path) for path in data_files]
+        )
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        print(f"Report generated successfully: {output_path}")
         
         return output_path
 
@@ -272,7 +533,7 @@ def main():
     print("=" * 40)
     
     # Get file path from user
-    file_path = input("Enter the path to your data file (CSV, Excel, or JSON): ").strip()
+    file_path = input("Enter the path to your data file (CSV, Parquet, Excel, JSON, or NDJSON): ").strip()
     
     if not file_path or not os.path.exists(file_path):
         print("Creating sample data for demonstration...")
@@ -291,35 +552,40 @@ def main():
         if not report_title:
             report_title = "Automated Data Analysis Report"
         
-        output_file = f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        generator.generate_pdf_report(output_file, report_title)
+        report_format = input("Enter report format - pdf or html (or press Enter for pdf): ").strip().lower()
+        if report_format not in ['pdf', 'html']:
+            report_format = 'pdf'
+        
+        output_file = f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{report_format}"
+        if report_format == 'html':
+            generator.generate_html_report(output_file, report_title)
+        else:
+            generator.generate_pdf_report(output_file, report_title)
         
         print(f"\nReport generated: {output_file}")
     else:
         print("Failed to load data. Please check your file path and format.")
 
-def create_sample_data():
-    """Create sample data for demonstration"""
-    np.random.seed(42)
+def create_sample_data(rng=None):
+    """Create sample data for demonstration, drawing from ``rng`` (seeded Generator by default)"""
+    if rng is None:
+        rng = np.random.default_rng(42)
+    n_rows = 1000
     
     # Generate sample sales data
     dates = pd.date_range('2024-01-01', periods=365, freq='D')
     products = ['Product A', 'Product B', 'Product C', 'Product D', 'Product E']
     regions = ['North', 'South', 'East', 'West']
     
-    data = []
-    for _ in range(1000):
-        data.append({
-            'Date': np.random.choice(dates),
-            'Product': np.random.choice(products),
-            'Region': np.random.choice(regions),
-            'Sales_Amount': np.random.normal(1000, 300),
-            'Quantity': np.random.randint(1, 50),
-            'Customer_Age': np.random.randint(18, 80),
-            'Customer_Satisfaction': np.random.uniform(1, 5)
-        })
-    
-    df = pd.DataFrame(data)
+    df = pd.DataFrame({
+        'Date': rng.choice(dates.values, n_rows),
+        'Product': rng.choice(products, n_rows),
+        'Region': rng.choice(regions, n_rows),
+        'Sales_Amount': rng.normal(1000, 300, n_rows),
+        'Quantity': rng.integers(1, 50, n_rows),
+        'Customer_Age': rng.integers(18, 80, n_rows),
+        'Customer_Satisfaction': rng.uniform(1, 5, n_rows)
+    })
     df['Sales_Amount'] = df['Sales_Amount'].clip(lower=0)  # No negative sales
     df.to_csv('sample_sales_data.csv', index=False)
     print("Sample data created: sample_sales_data.csv")
@@ -0,0 +1,19 @@
+import pytest
+
+import DATA_GEN
+
+
+def test_polars_sales_data_matches_pandas():
+    pytest.importorskip('polars')
+    expected = DATA_GEN.create_sales_data()
+    actual = DATA_GEN.create_sales_data_polars().to_pandas()
+
+    assert list(actual.columns) == list(expected.columns)
+    assert (actual.dtypes == expected.dtypes).all()
+    assert actual.equals(expected)
+
+
+def test_polars_sales_data_requires_polars(monkeypatch):
+    monkeypatch.setattr(DATA_GEN, 'pl', None)
+    with pytest.raises(ImportError, match='polars'):
+        DATA_GEN.create_sales_data_polars()
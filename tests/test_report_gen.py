@@ -0,0 +1,107 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import REPORT_GEN
+
+
+@pytest.fixture
+def stream_in_small_chunks(monkeypatch):
+    if REPORT_GEN.ijson is None:
+        pytest.skip("ijson is not installed")
+    monkeypatch.setattr(REPORT_GEN, 'JSON_STREAM_BYTES', 10)
+    monkeypatch.setattr(REPORT_GEN, 'JSON_STREAM_ROWS', 3)
+
+
+def write_json(tmp_path, records):
+    path = tmp_path / 'records.json'
+    path.write_text(json.dumps(records))
+    return str(path)
+
+
+def test_streamed_json_widens_types_and_adds_late_keys(tmp_path, stream_in_small_chunks):
+    records = [
+        {'a': 1, 'b': 'x'},
+        {'a': 2, 'b': 'y'},
+        {'a': 3, 'b': 'v'},
+        {'a': 4.5, 'b': 'z'},
+        {'a': 5, 'b': 'w', 'c': 1},
+    ]
+    df = REPORT_GEN.read_json_records(write_json(tmp_path, records))
+
+    assert df['a'].tolist() == [1.0, 2.0, 3.0, 4.5, 5.0]
+    assert df['b'].tolist() == ['x', 'y', 'v', 'z', 'w']
+    assert df['c'].isna().sum() == 4
+    assert df['c'].iloc[-1] == 1
+
+
+def test_streamed_json_falls_back_on_incompatible_types(tmp_path, stream_in_small_chunks, monkeypatch):
+    records = [{'a': 1}, {'a': 2}, {'a': 3}, {'a': 'text'}]
+    path = write_json(tmp_path, records)
+    streamed = REPORT_GEN.read_json_records(path)
+
+    monkeypatch.setattr(REPORT_GEN, 'JSON_STREAM_BYTES', 10 ** 9)
+    in_memory = REPORT_GEN.read_json_records(path)
+    pd.testing.assert_frame_equal(streamed, in_memory)
+    assert streamed['a'].tolist() == [1, 2, 3, 'text']
+
+
+def test_streamed_json_matches_in_memory_read(tmp_path, stream_in_small_chunks, monkeypatch):
+    records = [{'a': i, 'b': f'row{i}', 'c': i / 2} for i in range(10)]
+    path = write_json(tmp_path, records)
+    streamed = REPORT_GEN.read_json_records(path)
+
+    monkeypatch.setattr(REPORT_GEN, 'JSON_STREAM_BYTES', 10 ** 9)
+    in_memory = REPORT_GEN.read_json_records(path)
+
+    assert np.allclose(streamed['c'], in_memory['c'])
+    assert streamed['a'].tolist() == in_memory['a'].tolist()
+    assert streamed['b'].tolist() == in_memory['b'].tolist()
+
+
+def test_generate_charts_follows_reassigned_data():
+    rng = np.random.default_rng(0)
+    generator = REPORT_GEN.AutomatedReportGenerator()
+    generator.data = pd.DataFrame({'x': rng.random(20), 'y': rng.random(20), 'label': ['a', 'b'] * 10})
+    generator.analyze_data()
+
+    generator.data = pd.DataFrame({'p': rng.random(20), 'q': rng.random(20), 'r': rng.random(20)})
+    charts = generator.generate_charts()
+
+    assert [name for name, _ in charts] == ['overview_dashboard', 'correlation_matrix']
+    assert list(generator.compute_correlations().columns) == ['p', 'q', 'r']
+
+
+def test_cached_results_follow_data_without_analyze():
+    generator = REPORT_GEN.AutomatedReportGenerator()
+    generator.data = pd.DataFrame({'x': [1.0, 2.0, 3.0], 'y': [3.0, 1.0, 2.0], 'label': ['a', 'b', 'a']})
+    assert list(generator.compute_correlations().columns) == ['x', 'y']
+    assert generator.compute_category_counts()['label'].to_dict() == {'a': 2, 'b': 1}
+
+    generator.data = pd.DataFrame({'p': [1.0, 2.0], 'q': [2.0, 1.0], 'kind': ['u', 'v']})
+    assert list(generator.compute_correlations().columns) == ['p', 'q']
+    assert list(generator.compute_category_counts()) == ['kind']
+
+
+def test_categorical_summary_and_chart_share_counts():
+    generator = REPORT_GEN.AutomatedReportGenerator()
+    generator.data = pd.DataFrame({'label': ['a', 'b', 'a', 'c', 'a', 'b', None], 'x': range(7)})
+    generator.analyze_data()
+
+    summary = generator.analysis_results['categorical_summary']['label']
+    assert summary['unique_values'] == 3
+    assert summary['top_values'] == {'a': 3, 'b': 2, 'c': 1}
+
+    counts = generator.compute_category_counts()
+    generator.generate_charts()
+    assert generator.compute_category_counts() is counts
+
+
+def test_missing_values_counted_once_for_repeated_labels():
+    generator = REPORT_GEN.AutomatedReportGenerator()
+    generator.data = pd.DataFrame([[1.0, np.nan, 3.0], [np.nan, 5.0, 6.0]], columns=['a', 'a', 'b'])
+    generator.analyze_data()
+
+    assert generator.analysis_results['basic_stats']['missing_values'] == 2